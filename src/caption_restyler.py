@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+from draft_manager import DraftManager
+from version_adapter import BcutVersionAdapter
+
+
+def restyle_draft(json_path: str, style: Dict[str, Dict[str, Any]], backup_dir: str) -> Dict[str, Any]:
+    """
+    备份并修改单个草稿的字幕样式（在工作进程中执行）
+    :param json_path: 草稿项目文件路径
+    :param style: 样式配置
+    :param backup_dir: 备份目录
+    :return: 处理结果
+    """
+    start = time.perf_counter()
+    json_path = Path(json_path)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # 不同草稿的项目文件可能同名，备份名中加入草稿目录名
+    backup_path = Path(backup_dir) / f"{json_path.parent.name}_{json_path.stem}_{timestamp}{json_path.suffix}"
+    shutil.copy2(json_path, backup_path)
+
+    adapter = BcutVersionAdapter(str(json_path))
+    adapter.load_config()
+    count, unknown = adapter.apply_caption_style(style)
+    # 没有字幕片段被修改时不重写项目文件
+    if count:
+        adapter.save_config()
+
+    return {
+        'path': str(json_path),
+        'backup': str(backup_path),
+        'clips': count,
+        'unknown': unknown,
+        'elapsed': time.perf_counter() - start
+    }
+
+
+class CaptionRestyler:
+    def __init__(self, style_path: str):
+        """
+        初始化批量样式修改器
+        :param style_path: 样式配置JSON文件路径，形如 {"new": {...}, "old": {...}}
+        """
+        self.workspace = Path(__file__).parent.parent
+        self.backup_dir = self.workspace / 'backup'
+        self.backup_dir.mkdir(exist_ok=True)
+        self.draft_manager = DraftManager()
+
+        with open(style_path, 'r', encoding='utf-8') as f:
+            self.style = json.load(f)
+        if not isinstance(self.style, dict) or not ({'new', 'old'} & self.style.keys()):
+            raise ValueError(f"样式配置格式错误，需包含 new 或 old 字段: {style_path}")
+        self._report_protected_fields()
+
+    def _report_protected_fields(self):
+        """提示样式配置中会被忽略的文本、时间和ID字段"""
+        protected_fields = {
+            'new': BcutVersionAdapter.NEW_PROTECTED_FIELDS,
+            'old': BcutVersionAdapter.OLD_PROTECTED_FIELDS
+        }
+        for version, protected in protected_fields.items():
+            ignored = [key for key in self.style.get(version, {}) if key in protected]
+            if ignored:
+                print(f"以下{version}字段不是样式字段，将被忽略: {', '.join(ignored)}")
+
+    def select_drafts(self) -> List[Dict]:
+        """让用户选择多个草稿"""
+        print("\n=== 可用的草稿列表 ===")
+        drafts = self.draft_manager.list_drafts()
+        for i, draft in enumerate(drafts, 1):
+            print(f"[{i}] {self.draft_manager.format_draft_info(draft)}")
+
+        while True:
+            choice = input("\n请选择要修改样式的草稿编号，用逗号分隔（输入a全选，q退出）: ").strip()
+            if choice.lower() == 'q':
+                return []
+            if choice.lower() == 'a':
+                return drafts
+            try:
+                indexes = [int(part) - 1 for part in choice.split(',') if part.strip()]
+            except ValueError:
+                print("请输入有效的数字")
+                continue
+            if indexes and all(0 <= index < len(drafts) for index in indexes):
+                return [drafts[index] for index in dict.fromkeys(indexes)]
+            print("无效的选择，请重试")
+
+    def restyle(self, drafts: List[Dict], workers: int = None) -> List[Dict[str, Any]]:
+        """
+        并行修改多个草稿的字幕样式
+        :param drafts: 草稿列表
+        :param workers: 工作进程数，默认为CPU核心数
+        :return: 每个草稿的处理结果
+        """
+        results = []
+        workers = workers or min(len(drafts), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for draft in drafts:
+                try:
+                    json_path = self.draft_manager.get_latest_json_file(draft['id'])
+                except FileNotFoundError as e:
+                    print(f"{draft['name']}: 处理失败: {str(e)}")
+                    continue
+                future = executor.submit(restyle_draft, str(json_path), self.style, str(self.backup_dir))
+                futures[future] = draft['name']
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"{name}: 处理失败: {str(e)}")
+                    continue
+                result['name'] = name
+                results.append(result)
+                print(f"{name}: 修改 {result['clips']} 个字幕，耗时 {result['elapsed']:.2f}s，"
+                      f"备份: {Path(result['backup']).name}")
+                if result['unknown']:
+                    print(f"{name}: 以下字段在字幕中不存在，未修改: {', '.join(result['unknown'])}")
+        return results
+
+    def process(self):
+        """主处理流程"""
+        try:
+            drafts = self.select_drafts()
+            if not drafts:
+                print("用户取消操作")
+                return False
+
+            start = time.perf_counter()
+            results = self.restyle(drafts)
+            print(f"\n完成 {len(results)}/{len(drafts)} 个草稿，总耗时 {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            print(f"\n处理失败: {str(e)}")
+            return False
+
+        return True
+
+
+def main():
+    """主函数"""
+    style_path = input("请输入样式配置文件路径: ").strip()
+    try:
+        restyler = CaptionRestyler(style_path)
+    except (OSError, ValueError) as e:
+        print(f"\n处理失败: {str(e)}")
+        return
+    restyler.process()
+
+if __name__ == "__main__":
+    main()
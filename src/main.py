@@ -82,7 +82,7 @@ class BcutHelper:
             # 5. 执行转换
             converter = SrtToBcut(str(json_path), str(srt_file))
             output_file = converter.convert()
-            print(f"字幕导入完成: {output_file}")
+            print(f"字幕导入完成: {output_file}（字幕编码: {converter.encoding}）")
             
             # 6. 移动处理完的srt文件到completed目录
             completed_path = self.completed_dir / srt_file.name
@@ -1,3 +1,4 @@
+import codecs
 import json
 import re
 from datetime import datetime
@@ -6,6 +7,18 @@ from pathlib import Path
 from version_adapter import BcutVersionAdapter
 
 class SrtToBcut:
+    # 用于检测编码的文件前缀长度
+    SNIFF_SIZE = 4096
+    # BOM与编码的对应关系，UTF-32需在UTF-16之前判断
+    BOM_ENCODINGS = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    TIME_LINE_PATTERN = re.compile(r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\s*$')
+
     def __init__(self, json_template_path: str, srt_file_path: str):
         """
         初始化转换器
@@ -17,6 +30,7 @@ class SrtToBcut:
         self.adapter = BcutVersionAdapter(json_template_path)
         self.config = None
         self.base_clip = None
+        self.encoding = None
 
     @staticmethod
     def parse_srt_time(time_str: str) -> int:
@@ -31,37 +45,98 @@ class SrtToBcut:
                   time_obj.second * 1000 + 
                   time_obj.microsecond / 1000)
 
+    @staticmethod
+    def detect_encoding(prefix: bytes) -> str:
+        """
+        根据文件开头的字节检测编码：优先识别BOM，否则对前几KB做简单判断
+        :param prefix: 文件开头的字节
+        :return: 编码名称
+        """
+        for bom, encoding in SrtToBcut.BOM_ENCODINGS:
+            if prefix.startswith(bom):
+                return encoding
+
+        # 无BOM的UTF-16文本中ASCII字符会带有大量空字节
+        if prefix.count(b'\x00') > len(prefix) // 4:
+            even_zeros = prefix[0::2].count(b'\x00')
+            odd_zeros = prefix[1::2].count(b'\x00')
+            return 'utf-16-be' if even_zeros > odd_zeros else 'utf-16-le'
+
+        # 前缀末尾可能截断多字节字符，使用增量解码器且不结束解码
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(prefix, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'gb18030'
+
     def parse_srt(self) -> list:
         """
-        解析SRT文件
+        解析SRT文件，自动检测编码并逐行解码
         :return: 字幕列表
         """
-        with open(self.srt_file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()  # 去除文件末尾的空白字符
+        with open(self.srt_file_path, 'rb') as raw:
+            self.encoding = self.detect_encoding(raw.read(self.SNIFF_SIZE))
+        try:
+            subtitles = self._parse_srt_lines(self.encoding)
+        except UnicodeDecodeError:
+            if self.encoding != 'utf-8':
+                raise
+            # 前缀恰好只有ASCII时可能误判为UTF-8，改用GB18030重新解析
+            self.encoding = 'gb18030'
+            subtitles = self._parse_srt_lines(self.encoding)
 
-        # 修改正则表达式，使其更准确地匹配SRT格式
-        subtitle_pattern = r'(\d+)\r?\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\r?\n((?:.+(?:\r?\n)?)+)'
-        subtitles = []
-        
-        for match in re.finditer(subtitle_pattern, content):
-            index = int(match.group(1))
-            start_time = self.parse_srt_time(match.group(2))
-            end_time = self.parse_srt_time(match.group(3))
-            text = match.group(4).strip()
-            
-            subtitle = {
-                'index': index,
-                'start': start_time,
-                'end': end_time,
-                'text': text,
-                'duration': end_time - start_time
-            }
-            subtitles.append(subtitle)
+        # 解析成功后再输出，避免重新解析时重复打印
+        for subtitle in subtitles:
             print(f"解析到字幕: {subtitle}")  # 添加调试信息
-        
+        print(f"检测到字幕文件编码: {self.encoding}")
         print(f"总共解析到 {len(subtitles)} 个字幕")  # 添加调试信息
         return subtitles
 
+    def _parse_srt_lines(self, encoding: str) -> list:
+        """
+        按行流式解析SRT文件
+        :param encoding: 文件编码
+        :return: 字幕列表
+        """
+        subtitles = []
+        index = None
+        times = None
+        text_lines = []
+
+        def flush():
+            if times is not None and text_lines:
+                start_time, end_time = times
+                subtitle = {
+                    'index': index,
+                    'start': start_time,
+                    'end': end_time,
+                    'text': '\n'.join(text_lines).strip(),
+                    'duration': end_time - start_time
+                }
+                subtitles.append(subtitle)
+
+        with open(self.srt_file_path, 'r', encoding=encoding) as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                if times is None:
+                    # 等待序号行和紧随其后的时间行
+                    time_match = self.TIME_LINE_PATTERN.match(line)
+                    if index is not None and time_match:
+                        times = (self.parse_srt_time(time_match.group(1)),
+                                 self.parse_srt_time(time_match.group(2)))
+                    else:
+                        # isdigit()对'①'等字符也返回True，但int()无法转换
+                        index = int(line.strip()) if line.strip().isdecimal() else None
+                elif line:
+                    text_lines.append(line)
+                else:
+                    # 空行表示当前字幕结束，只含空白字符的行仍属于字幕文本
+                    flush()
+                    index, times, text_lines = None, None, []
+            flush()
+
+        return subtitles
+
     def create_subtitle_clip_template(self) -> dict:
         """
         创建基础字幕片段模板
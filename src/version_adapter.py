@@ -1,12 +1,21 @@
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Iterator
 import copy
 from datetime import datetime
 
 class BcutVersionAdapter:
     """必剪版本适配器，处理新旧版本格式的兼容性"""
     
+    # 批量修改样式时不允许覆盖的字段（文本、时间和ID）
+    NEW_PROTECTED_FIELDS = frozenset({
+        'captionText', 'assetInfo', 'inPoint', 'outPoint', 'idString', 'uid'
+    })
+    OLD_PROTECTED_FIELDS = frozenset({
+        'AssetInfo', '30011', '30012', '30021', 'duration', 'inPoint', 'outPoint',
+        'trimIn', 'trimOut', 'm_id'
+    })
+    
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
         self.is_new_version = self.file_path.suffix == '.bjson'
@@ -80,6 +89,67 @@ class BcutVersionAdapter:
         
         return new_track, []
     
+    def iter_caption_clips(self) -> Iterator[Dict[str, Any]]:
+        """遍历所有字幕轨道中的字幕片段，不会创建新轨道"""
+        if self.is_new_version:
+            timeline = self.config.get('timelineWidget', {}).get('timeline', {})
+            for track in timeline.get('captionTracks', []):
+                yield from track.get('captions') or []
+        else:
+            for track in self.config.get('tracks', []):
+                if track.get('BTrackType') == 0 and not track.get('MiddleTrack', False):
+                    yield from track.get('clips') or []
+    
+    def get_protected_fields(self) -> frozenset:
+        """获取当前版本批量修改样式时不允许覆盖的字段"""
+        return self.NEW_PROTECTED_FIELDS if self.is_new_version else self.OLD_PROTECTED_FIELDS
+    
+    def apply_caption_style(self, style: Dict[str, Dict[str, Any]]) -> Tuple[int, List[str]]:
+        """
+        原地修改所有字幕片段中已有的样式字段，文本和时间保持不变
+        :param style: 样式配置，形如 {"new": {...}, "old": {...}}，按版本选取对应字段
+        :return: 修改的字幕片段数量，以及在所有字幕片段中都不存在的字段
+        """
+        fields = style.get(self.detect_version(), {})
+        protected = self.get_protected_fields()
+        fields = {key: value for key, value in fields.items() if key not in protected}
+        if not fields:
+            return 0, []
+        
+        count = 0
+        matched = set()
+        for clip in self.iter_caption_clips():
+            patched = self._patch_fields(clip, fields, '', matched)
+            if patched:
+                count += 1
+        
+        unknown = [key for key in self._flatten_keys(fields, '') if key not in matched]
+        return count, unknown
+    
+    def _patch_fields(self, target: Dict[str, Any], fields: Dict[str, Any], prefix: str, matched: set) -> bool:
+        """只修改目标中已存在的字段，嵌套字段（如textColor）逐项合并"""
+        patched = False
+        for key, value in fields.items():
+            if key not in target:
+                continue
+            if isinstance(value, dict) and isinstance(target[key], dict):
+                patched |= self._patch_fields(target[key], value, f"{prefix}{key}.", matched)
+            else:
+                target[key] = copy.deepcopy(value)
+                matched.add(f"{prefix}{key}")
+                patched = True
+        return patched
+    
+    def _flatten_keys(self, fields: Dict[str, Any], prefix: str) -> List[str]:
+        """展开样式配置中的字段名，嵌套字段用点号连接"""
+        keys = []
+        for key, value in fields.items():
+            if isinstance(value, dict) and value:
+                keys.extend(self._flatten_keys(value, f"{prefix}{key}."))
+            else:
+                keys.append(f"{prefix}{key}")
+        return keys
+    
     def create_subtitle_clip(self, subtitle_data: Dict[str, Any], existing_clip: Any = None) -> Dict[str, Any]:
         """创建字幕片段，根据版本使用不同格式"""
         if self.is_new_version: